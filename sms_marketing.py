@@ -2,28 +2,101 @@
 # Code under MIT License
 # Basically, to use my code you just need to include my name and my e-mail wherever you use this code.
 
-import json
+import argparse
+import asyncio
+import logging
+import mmap
+import os
+import queue
 import threading
 import time
-from copy import deepcopy
+from logging.handlers import QueueHandler, QueueListener
 from os.path import isfile
-from shutil import copyfile
 from typing import Type, Union
 
+import orjson
+from aiohttp import ClientConnectorError, ClientError, ClientSession, TCPConnector
+from aiohttp_retry import ExponentialRetry, RetryClient
 from twilio.base.exceptions import TwilioRestException
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 from twilio.rest import Client
 
+logger = logging.getLogger(__name__)
+
+# Senders log to this child logger. While a campaign runs its records are only put on a queue, and a single
+# listener thread hands them to `logger`, so writing them out never blocks a send. Levels, handlers and
+# propagation of `logger` are left to the application.
+_send_logger = logger.getChild('send')
+_log_queue = queue.SimpleQueue()
+
+
+class _ForwardHandler(logging.Handler):
+    """Logging handler passing records taken off the queue to the module logger."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger.handle(record)
+
+
+class _SendLogging:
+    """Routes `_send_logger` through the log queue while at least one campaign is running."""
+
+    _listener = QueueListener(_log_queue, _ForwardHandler())
+    _handler = QueueHandler(_log_queue)
+    _lock = threading.Lock()
+    _runs = 0
+    _previous_propagate = True
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        Start queueing send log records, unless another campaign already did.
+        """
+
+        with cls._lock:
+            if cls._runs == 0:
+                cls._previous_propagate = _send_logger.propagate
+                _send_logger.addHandler(cls._handler)
+                _send_logger.propagate = False
+                cls._listener.start()
+
+            cls._runs += 1
+
+    @classmethod
+    def stop(cls) -> None:
+        """
+        Stop queueing send log records once the last running campaign ends, flushing the queue and restoring
+        the previous propagation of `_send_logger`.
+        """
+
+        with cls._lock:
+            cls._runs -= 1
+
+            if cls._runs == 0:
+                _send_logger.removeHandler(cls._handler)
+                _send_logger.propagate = cls._previous_propagate
+                cls._listener.stop()
 
 class TelephonesStorage:
     """Class for monitoring and updating telephone states."""
 
-    telephones = {}
+    COMPACT_EVERY = 1000
+
+    numbers = []
+    sent = bytearray()
+    _other_states = {}
     path_to_json = None
+    _deltas = 0
+    _updates = queue.SimpleQueue()
+    _stop = threading.Event()
 
     @staticmethod
     def set_telephones(path_to_json: str) -> None:
         """
-        Set the path to the JSON file containing telephone states and load the data into the telephones dictionary.
+        Set the path to the JSON file containing telephone states and load the data into two parallel arrays:
+        the `numbers` list of mobile numbers and the `sent` bytearray holding 0 for every number marked
+        false, which has not received the SMS yet.
+
+        Changes logged by `_save_delta` since the last save of the JSON file are replayed on top of it.
 
         Args:
             path_to_json (str): The path to the JSON file containing telephone states.
@@ -31,11 +104,108 @@ class TelephonesStorage:
 
         TelephonesStorage.path_to_json = path_to_json
 
-        with open(path_to_json, 'r', encoding='utf-8') as f:
-            TelephonesStorage.telephones = json.loads(f.read())
-        
-        if isfile(path_to_json + '.bak') is False:
-            copyfile(path_to_json, path_to_json + '.bak')
+        # The file is parsed straight from the page cache instead of being read into a bytes copy first.
+        with open(path_to_json, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buffer:
+                telephones = orjson.loads(buffer)
+
+        if isfile(path_to_json + '.log'):
+            TelephonesStorage._replay_deltas(path_to_json + '.log', telephones)
+
+        # Only numbers marked false are sent to. Any other value is kept as it is and saved back unchanged.
+        TelephonesStorage.numbers = list(telephones)
+        TelephonesStorage.sent = bytearray(state is not False for state in telephones.values())
+        TelephonesStorage._other_states = {
+            index: state for index, state in enumerate(telephones.values()) if state is not True and state is not False
+        }
+
+    @staticmethod
+    def _replay_deltas(path_to_log: str, telephones: dict) -> None:
+        """
+        Apply the changes from the log file written by `_save_delta` to the telephones dictionary.
+
+        A last line that does not parse was torn by a crash in the middle of `_save_delta`, so it is cut
+        off the log file instead of failing the load. A line that does not parse anywhere else is real
+        corruption and raises.
+
+        Args:
+            path_to_log (str): The path to the log file.
+            telephones (dict): The telephone states loaded from the JSON file.
+
+        Raises:
+            orjson.JSONDecodeError: If a line other than the last one is not valid JSON.
+        """
+
+        with open(path_to_log, 'r+b') as f:
+            lines = f.readlines()
+            offset = 0
+
+            for n, line in enumerate(lines):
+                try:
+                    if line.strip():
+                        telephones.update(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    if n < len(lines) - 1:
+                        raise
+
+                    f.truncate(offset)
+                    return
+
+                offset += len(line)
+
+            # A complete last line without its newline would otherwise be glued to the next appended one.
+            if lines and not lines[-1].endswith(b'\n'):
+                f.write(b'\n')
+
+    @classmethod
+    def pending(cls) -> list:
+        """
+        Get the positions of mobile numbers that have not received the SMS yet, in the order of the JSON file.
+
+        Returns:
+            list: The indexes into `numbers` whose `sent` flag is 0.
+        """
+
+        sent, indexes = cls.sent, []
+        index = sent.find(0)
+
+        while index != -1:
+            indexes.append(index)
+            index = sent.find(0, index + 1)
+
+        return indexes
+
+    @classmethod
+    def mark_as_sent(cls, *indexes: int) -> None:
+        """
+        Mark mobile numbers as sent by queueing them for the watcher thread, which is the only writer
+        of telephone states.
+
+        Args:
+            *indexes (int): The positions in `numbers` of the mobile numbers that received the SMS.
+        """
+
+        for index in indexes:
+            cls._updates.put(index)
+
+    @classmethod
+    def _save_delta(cls, *mobile_numbers: str) -> None:
+        """
+        Append changed telephone states to the log file next to the JSON file.
+
+        Every mobile number is written as a separate `{"number": true}` line, so a single change costs
+        one line instead of a rewrite of the whole JSON file.
+
+        Args:
+            *mobile_numbers (str): The mobile numbers that received the SMS.
+        """
+
+        with open(cls.path_to_json + '.log', 'ab') as f:
+            f.write(b''.join(orjson.dumps({mobile_number: True}) + b'\n' for mobile_number in mobile_numbers))
+            f.flush()
+            os.fsync(f.fileno())
+
+        cls._deltas += len(mobile_numbers)
 
     @classmethod
     def watch_telephones_state(cls) -> None:
@@ -44,53 +214,169 @@ class TelephonesStorage:
         """
 
         if not hasattr(cls, 'thread') or not cls.thread.is_alive():
+            cls._stop.clear()
             cls.thread = threading.Thread(target=cls._watch_thread)
+            cls.thread.daemon = True
             cls.thread.start()
 
+    @classmethod
+    def stop_watching(cls) -> None:
+        """
+        Stop the watcher thread and wait until it saves the remaining telephone states.
+        """
+
+        cls._stop.set()
+        cls._updates.put(None)
+
+        if hasattr(cls, 'thread'):
+            cls.thread.join()
+
     @classmethod
     def _watch_thread(cls) -> None:
         """
         Internal thread function for monitoring and updating telephone states.
 
-        This method runs in a separate thread and periodically checks for changes in telephone states
-        and saves them to the JSON file if changes occur.
+        This method runs in a separate thread, drains every index queued by `mark_as_sent` at once
+        and applies the whole batch with a single write to the log file. The JSON file is rewritten only
+        once `COMPACT_EVERY` changes pile up and when the thread is stopped.
         """
 
-        previous_state = deepcopy(cls.telephones)
+        path, updates, stop, compact_every = cls.path_to_json, cls._updates, cls._stop, cls.COMPACT_EVERY
+
+        while not stop.is_set():
+            try:
+                batch = [updates.get(timeout=0.25)]
+            except queue.Empty:
+                continue
+
+            cls._apply_updates(cls._drain_updates(batch))
+
+            if cls._deltas >= compact_every:
+                cls._save_state_to_file(path)
+
+        cls._apply_updates(cls._drain_updates([]))
+
+        if cls._deltas:
+            cls._save_state_to_file(path)
+
+    @classmethod
+    def _drain_updates(cls, batch: list) -> list:
+        """
+        Move every index waiting in the updates queue to the batch.
+
+        Args:
+            batch (list): The indexes already taken from the queue.
+
+        Returns:
+            list: The batch of indexes, without the `None` put by `stop_watching`.
+        """
 
         while True:
-            if previous_state != cls.telephones:
-                previous_state = deepcopy(cls.telephones)
-                cls._save_state_to_file()
+            try:
+                batch.append(cls._updates.get_nowait())
+            except queue.Empty:
+                break
+
+        return [index for index in batch if index is not None]
+
+    @classmethod
+    def _apply_updates(cls, indexes: list) -> None:
+        """
+        Mark a batch of mobile numbers as sent in memory and in the log file.
+
+        Args:
+            indexes (list): The positions in `numbers` of the mobile numbers that received the SMS.
+        """
+
+        if not indexes:
+            return
+
+        for index in indexes:
+            cls.sent[index] = 1
 
-            time.sleep(0.25)
+        cls._save_delta(*(cls.numbers[index] for index in indexes))
 
     @classmethod
-    def _save_state_to_file(cls) -> None:
+    def _save_state_to_file(cls, path: str = None) -> None:
         """
         Save telephone states to a JSON file.
 
-        This method saves the current state of telephone states in the `telephones` dictionary to the
-        JSON file specified by `path_to_json`.
+        This method saves the current state of telephone states in `numbers` and `sent` to the JSON file
+        specified by `path_to_json` and empties the log file, whose changes are now included.
+        The JSON file is written to a temporary file first and swapped in, so it is never left half-written.
+
+        Args:
+            path (str, optional): The path to the JSON file. Defaults to `path_to_json`.
         """
 
-        with open(TelephonesStorage.path_to_json, 'w', encoding='utf-8') as f:
-            json.dump(cls.telephones, f, indent=4)
+        path = path or cls.path_to_json
+
+        with open(path + '.tmp', 'wb') as f:
+            telephones = dict(zip(cls.numbers, map(bool, cls.sent)))
+
+            for index, state in cls._other_states.items():
+                telephones[cls.numbers[index]] = state
+
+            f.write(orjson.dumps(telephones))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(path + '.tmp', path)
+        open(path + '.log', 'wb').close()
+        cls._deltas = 0
 
 class SMSMarketing:
     """A class for managing SMS marketing campaigns using Twilio."""
 
+    BATCH_SIZE = 100
+    MAX_WORKERS = 16
+    MESSAGES_PER_SECOND = None
+
+    class _RateLimiter:
+        """A private inner class implementing a token bucket that limits the number of SMS messages sent per second."""
+
+        def __init__(self, messages_per_second: float) -> None:
+            """
+            Initialize a rate limiter with a full bucket.
+
+            Args:
+                messages_per_second (float): The number of tokens refilled per second.
+            """
+
+            self.messages_per_second = messages_per_second
+            self.capacity = max(1, messages_per_second)
+            self.tokens = self.capacity
+            self.updated_at = time.monotonic()
+
+        async def acquire(self) -> None:
+            """
+            Take one token from the bucket, sleeping until it is refilled if it is empty.
+            """
+
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.messages_per_second)
+            self.updated_at = now
+
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.messages_per_second)
+                self.tokens = 1
+                self.updated_at = time.monotonic()
+
+            self.tokens -= 1
+
     class _SMS:
         """A private inner class for representing individual SMS messages."""
+
+        __slots__ = ('body', 'from_', 'to', 'nofN')
         
-        def __init__(self, body: str, from_: str, to: str, nofN: tuple = None) -> None:
+        def __init__(self, body: str, from_: str, to: Union[str, list], nofN: tuple = None) -> None:
             """
             Initialize an SMS object.
             
             Args:
                 body (str): The SMS message content.
                 from_ (str): The sender's mobile number or alphanumeric sender ID.
-                to (str): The recipient's mobile number.
+                to (Union[str, list]): The recipient's mobile number or a list of them for batch sends.
                 nofN (tuple, optional): A tuple representing the position and total number of SMS messages in a campaign.
 
             """
@@ -128,51 +414,166 @@ class SMSMarketing:
             self.storage = storage
             self.manager = manager
             self.sms = SMSMarketing._SMS(body=sms_body, from_=self.manager.mobile_number, to=None)
-            self.storage.watch_telephones_state()
+            self._base = {'body': sms_body, 'from_': self.manager.mobile_number}
+            self._create = None
+            self._notify = None
 
         def run_campaign(self) -> None:
             """
             Run the SMS marketing campaign, sending messages to eligible recipients.
+
+            Raises:
+                Exception: If called from a running event loop, where run_campaign_async has to be awaited instead.
+            """
+
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.run_campaign_async())
+            else:
+                raise Exception('run_campaign cannot be called from a running event loop, await run_campaign_async instead')
+
+        async def run_campaign_async(self) -> None:
+            """
+            Run the SMS marketing campaign in the current event loop, sending messages to eligible recipients.
+            """
+
+            _SendLogging.start()
+
+            try:
+                await self._run_campaign()
+            finally:
+                _SendLogging.stop()
+
+        async def _run_campaign(self) -> None:
+            """
+            Send the campaign's SMS messages from a single event loop.
+
+            Up to `max_workers` SMS messages are in flight at the same time, started no faster than
+            `messages_per_second` allows.
             """
 
-            numbers_to_send = {mobile_number: state for mobile_number, state in self.storage.telephones.items() if state is False}
-            length_of_numbers = len(numbers_to_send)
+            numbers = self.storage.numbers
+            indexes_to_send = self.storage.pending()
+            length_of_numbers = len(indexes_to_send)
+            client = self.manager._initialize_twilio_client()
+
+            async with client.http_client:
+                if self.manager.notify_service_sid is not None:
+                    self._notify = client.notify.services(self.manager.notify_service_sid).notifications.create_async
+                    batch_size = self.manager.batch_size
+
+                    for n in range(0, length_of_numbers, batch_size):
+                        indexes = indexes_to_send[n:n + batch_size]
+                        self.sms.to = [numbers[index] for index in indexes]
+                        self.sms.nofN = (min(n + batch_size, length_of_numbers), length_of_numbers)
+                        await self._send_bulk_sms(self.sms, indexes)
+
+                    return
+
+                self._create = client.messages.create_async
+                rate_limiter = None
+
+                if self.manager.messages_per_second is not None:
+                    rate_limiter = SMSMarketing._RateLimiter(self.manager.messages_per_second)
+
+                semaphore = asyncio.Semaphore(self.manager.max_workers)
+                in_flight = set()
+                failures = []
+
+                def on_done(task: asyncio.Task) -> None:
+                    in_flight.discard(task)
+                    semaphore.release()
+
+                    if not task.cancelled() and task.exception() is not None:
+                        failures.append(task.exception())
+
+                for n, index in enumerate(indexes_to_send, 1):
+                    await semaphore.acquire()
+
+                    if rate_limiter is not None:
+                        await rate_limiter.acquire()
 
-            for n, mobile_number in enumerate(numbers_to_send):
-                self.sms.to = mobile_number
-                self.sms.nofN = (n + 1, length_of_numbers)
-                self._send_sms(self.sms)
+                    # An unexpected error means a bug or a bad configuration, so no further sends are started.
+                    if failures:
+                        semaphore.release()
+                        break
 
-        def _send_sms(self, sms: Type['SMSMarketing._SMS']) -> Union[str, None]:
+                    sms = SMSMarketing._SMS(body=self.sms.body, from_=self.sms.from_, to=numbers[index], nofN=(n, length_of_numbers))
+                    task = asyncio.create_task(self._send_sms(sms, index))
+                    task.add_done_callback(on_done)
+                    in_flight.add(task)
+
+                # Only unfinished sends are kept, so memory stays bounded by max_workers. Every one of them is
+                # awaited before the first unexpected error is re-raised, so no request that may have reached
+                # Twilio is cancelled without being recorded.
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+                if failures:
+                    raise failures[0]
+
+        async def _send_sms(self, sms: Type['SMSMarketing._SMS'], index: int) -> Union[str, None]:
             """
             Send an SMS message.
 
             Args:
                 sms (Type['SMSMarketing._SMS']): The SMS message to send.
+                index (int): The position of the recipient in the storage's `numbers`.
 
             Returns:
                 Union[str, None]: The SID (Service Identifier) of the sent SMS or None if there was an error.
             """
 
             try:
-                sent_sms = self.manager.client.messages.create(
-                    body=sms.body,
-                    from_=sms.from_,
-                    to=sms.to
-                )
+                sent_sms = await self._create(to=sms.to, **self._base)
 
                 if sent_sms.sid is None:
-                    raise Exception('Something went wrong. SMS sid not received')
+                    _send_logger.error('Something went wrong. SMS sid not received for the SMS %r', sms)
+                    return None
                 
-                print(f'{sms.nofN[0]}/{sms.nofN[1]} Successfully sent SMS with data:\n{self.sms}\n')
+                _send_logger.info('%d/%d Successfully sent SMS with data:\n%s\n', sms.nofN[0], sms.nofN[1], sms)
                 
-                self.storage.telephones[sms.to] = True
-            except TwilioRestException as e:
-                print(f"{e}\nError raised during sending the SMS {sms.__dict__}")
+                self.storage.mark_as_sent(index)
+            except (TwilioRestException, ClientError, asyncio.TimeoutError, OSError) as e:
+                _send_logger.error('%s\nError raised during sending the SMS %r', e, sms)
                 return None
 
             return sent_sms.sid
 
+        async def _send_bulk_sms(self, sms: Type['SMSMarketing._SMS'], indexes: list) -> Union[str, None]:
+            """
+            Send one SMS message to a batch of recipients with a single Twilio Notify request.
+
+            The sender is configured on the Messaging Service attached to the Notify service, so `sms.from_`
+            is not used here.
+
+            Args:
+                sms (Type['SMSMarketing._SMS']): The SMS message to send, with `to` holding a list of mobile numbers.
+                indexes (list): The positions of the recipients in the storage's `numbers`.
+
+            Returns:
+                Union[str, None]: The SID of the created notification or None if there was an error.
+            """
+
+            try:
+                notification = await self._notify(
+                    to_binding=[orjson.dumps({'binding_type': 'sms', 'address': mobile_number}).decode() for mobile_number in sms.to],
+                    body=sms.body
+                )
+
+                if notification.sid is None:
+                    _send_logger.error('Something went wrong. Notification sid not received for the SMS batch %r', sms)
+                    return None
+
+                _send_logger.info('%d/%d Successfully sent SMS batch of %d with data:\n%s\n', sms.nofN[0], sms.nofN[1], len(sms.to), sms)
+
+                self.storage.mark_as_sent(*indexes)
+            except (TwilioRestException, ClientError, asyncio.TimeoutError, OSError) as e:
+                _send_logger.error('%s\nError raised during sending the SMS batch %r', e, sms)
+                return None
+
+            return notification.sid
+
     def __init__(self, account_sid: str, auth_token: str) -> None:
         """
         Initialize the SMSMarketing manager.
@@ -184,8 +585,11 @@ class SMSMarketing:
 
         self.account_sid = account_sid
         self.auth_token = auth_token
-        self.client = self._initialize_twilio_client()
         self.mobile_number = None
+        self.notify_service_sid = None
+        self.batch_size = SMSMarketing.BATCH_SIZE
+        self.max_workers = SMSMarketing.MAX_WORKERS
+        self.messages_per_second = SMSMarketing.MESSAGES_PER_SECOND
         self.campaign = None
 
     def set_mobile_number(self, mobile_number: str = None, alphanumeric_sender_id: str = None) -> None:
@@ -208,6 +612,45 @@ class SMSMarketing:
         
         self.mobile_number = mobile_number if mobile_number else alphanumeric_sender_id
 
+    def set_notify_service(self, notify_service_sid: str, batch_size: int = None) -> None:
+        """
+        Set the Twilio Notify service used to send SMS messages in batches instead of one request per recipient.
+
+        Args:
+            notify_service_sid (str): The SID of the Notify service with a Messaging Service attached.
+            batch_size (int, optional): The number of recipients per request. Defaults to BATCH_SIZE.
+
+        Raises:
+            Exception: If batch_size is not a positive number.
+        """
+
+        if batch_size is not None and batch_size < 1:
+            raise Exception('batch_size has to be a positive number')
+
+        self.notify_service_sid = notify_service_sid
+        self.batch_size = batch_size if batch_size else SMSMarketing.BATCH_SIZE
+
+    def set_throughput(self, max_workers: int = None, messages_per_second: float = None) -> None:
+        """
+        Set how many SMS messages are sent concurrently and how many are sent per second.
+
+        Args:
+            max_workers (int, optional): The number of SMS messages sent at the same time. Defaults to MAX_WORKERS.
+            messages_per_second (float, optional): The sending rate allowed by your sender. Defaults to MESSAGES_PER_SECOND, which does not limit the rate.
+
+        Raises:
+            Exception: If max_workers or messages_per_second is not a positive number.
+        """
+
+        if max_workers is not None and max_workers < 1:
+            raise Exception('max_workers has to be a positive number')
+
+        if messages_per_second is not None and messages_per_second <= 0:
+            raise Exception('messages_per_second has to be a positive number')
+
+        self.max_workers = max_workers if max_workers else SMSMarketing.MAX_WORKERS
+        self.messages_per_second = messages_per_second if messages_per_second else SMSMarketing.MESSAGES_PER_SECOND
+
     def create_campaign(self, campaign_name: str, storage: Type['TelephonesStorage'], sms_body: str) -> None:
         """
         Create an SMS marketing campaign.
@@ -231,26 +674,85 @@ class SMSMarketing:
     def run_campaign(self):
         """
         Run the SMS marketing campaign.
+
+        Telephone states are watched while the campaign runs and saved to the JSON file once it ends.
+
+        Raises:
+            Exception: If called from a running event loop, where run_campaign_async has to be awaited instead.
+        """
+
+        self.campaign.storage.watch_telephones_state()
+
+        try:
+            self.campaign.run_campaign()
+        finally:
+            self.campaign.storage.stop_watching()
+
+    async def run_campaign_async(self) -> None:
         """
+        Run the SMS marketing campaign in the current event loop, e.g. from Jupyter or an async application.
+
+        Telephone states are watched while the campaign runs and saved to the JSON file once it ends.
+        """
+
+        self.campaign.storage.watch_telephones_state()
 
-        self.campaign.run_campaign()
+        try:
+            await self.campaign.run_campaign_async()
+        finally:
+            await asyncio.to_thread(self.campaign.storage.stop_watching)
 
     def _initialize_twilio_client(self):
         """
-        Initialize the Twilio client.
+        Initialize an asynchronous Twilio client for a campaign run.
+
+        The client keeps up to `max_workers` pooled keep-alive connections, one per SMS message in flight,
+        so SMS messages do not pay for a new TLS handshake each. A request is retried up to 3 times only
+        when the connection could not be opened, because a POST that reached Twilio must not create the
+        message twice. It has to be created and closed inside the event loop that uses it.
 
         Returns:
             Client: The initialized Twilio client.
         """
 
-        return Client(self.account_sid, self.auth_token)
+        http_client = AsyncTwilioHttpClient(pool_connections=False)
+        http_client.session = RetryClient(
+            client_session=ClientSession(connector=TCPConnector(limit=self.max_workers)),
+            retry_options=ExponentialRetry(attempts=4, exceptions={ClientConnectorError}, retry_all_server_errors=False)
+        )
+
+        return Client(self.account_sid, self.auth_token, http_client=http_client)
+
+def main() -> None:
+    """
+    Run a campaign from the command line.
+
+    Twilio credentials are read from the TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN environment variables.
+    """
+
+    parser = argparse.ArgumentParser(description='Run an SMS marketing campaign using Twilio.')
+    parser.add_argument('path_to_json', help='The path to the JSON file containing telephone states.')
+    parser.add_argument('--campaign-name', required=True, help='The name of the campaign.')
+    parser.add_argument('--sms-body', required=True, help='The content of the SMS message for the campaign.')
+    sender = parser.add_mutually_exclusive_group(required=True)
+    sender.add_argument('--mobile-number', help="The sender's mobile number.")
+    sender.add_argument('--alphanumeric-sender-id', help='The alphanumeric sender ID.')
+    args = parser.parse_args()
+
+    for variable in ('TWILIO_ACCOUNT_SID', 'TWILIO_AUTH_TOKEN'):
+        if not os.environ.get(variable):
+            parser.error(f'the {variable} environment variable is required')
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    internal = SMSMarketing(account_sid=os.environ['TWILIO_ACCOUNT_SID'], auth_token=os.environ['TWILIO_AUTH_TOKEN'])
+    internal.set_mobile_number(mobile_number=args.mobile_number, alphanumeric_sender_id=args.alphanumeric_sender_id)
+
+    TelephonesStorage.set_telephones(path_to_json=args.path_to_json)
+
+    internal.create_campaign(campaign_name=args.campaign_name, storage=TelephonesStorage, sms_body=args.sms_body)
+
+    internal.run_campaign()
 
-if __name__ == "__main__:
-	internal = SMSMarketing(account_sid='XXXXXX', auth_token='XXXXX')
-	internal.set_mobile_number(alphanumeric_sender_id='XXXXX')
-	
-	storage = TelephonesStorage.set_telephones(path_to_json='XXXX.json')
-	
-	internal.create_campaign(campaign_name='XXXX', storage=TelephonesStorage, sms_body='XXXX')
-	
-	internal.run_campaign()
+if __name__ == "__main__":
+    main()